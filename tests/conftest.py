@@ -1,16 +1,23 @@
+import itertools
+import json
+import os
+import re
 import socket
 import subprocess
 import time
+import uuid
 import logging
-from typing import Generator, Dict, List
+from typing import Any, Callable, Generator, Dict, List, Union
 from contextlib import contextmanager
 
 import pytest
 import requests
 from faker import Faker
+from fastapi.testclient import TestClient
+from filelock import FileLock
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from playwright.sync_api import sync_playwright, Browser, Page
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Response
 
 from app.database import Base, get_engine, get_sessionmaker
 from app.models.user import User
@@ -30,7 +37,10 @@ logger = logging.getLogger(__name__)
 # Database Configuration
 # ======================================================================================
 fake = Faker()
-Faker.seed(12345)
+# Offset the seed per pytest-xdist worker ("gw0", "gw1", ...) so workers sharing
+# the test database don't generate the same "unique" usernames and emails.
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+Faker.seed(12345 + (int(_xdist_worker[2:]) + 1 if _xdist_worker else 0))
 
 test_engine = get_engine(database_url=settings.DATABASE_URL)
 TestingSessionLocal = get_sessionmaker(engine=test_engine)
@@ -48,6 +58,27 @@ def create_fake_user() -> Dict[str, str]:
         "password": fake.password(length=12)
     }
 
+# UI users draw names from a pool built once at import. Usernames and emails get a
+# uuid suffix, so they stay unique across workers and --preserve-db reruns.
+UI_TEST_PASSWORD = "SecurePass123!"
+_ui_fake = Faker()
+_ui_fake.seed_instance(os.getpid())
+_UI_PROFILES = itertools.cycle([_ui_fake.simple_profile() for _ in range(50)])
+
+def create_ui_user(prefix: str = "e2e") -> Dict[str, str]:
+    """Generate user data accepted by the registration form and /auth/register."""
+    profile = next(_UI_PROFILES)
+    suffix = uuid.uuid4().hex[:8]
+    names = profile["name"].split()
+    local_part, _, domain = profile["mail"].partition("@")
+    return {
+        "username": f"{prefix}_{suffix}",
+        "email": f"{local_part}.{suffix}@{domain}",
+        "first_name": names[0],
+        "last_name": names[-1],
+        "password": UI_TEST_PASSWORD,
+    }
+
 @contextmanager
 def managed_db_session():
     """Context manager for safe database session handling."""
@@ -86,12 +117,15 @@ class ServerStartupError(Exception):
 # ======================================================================================
 # Database Fixtures
 # ======================================================================================
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_database(request):
+def get_worker_id(config) -> str:
     """
-    Set up the test database before the session starts, and tear it down after tests
-    unless --preserve-db is provided.
+    Return the pytest-xdist worker id ("gw0", "gw1", ...), or "master" when the
+    session is not a worker, including when xdist is not installed at all.
     """
+    return getattr(config, "workerinput", {}).get("workerid", "master")
+
+def _reset_test_database() -> None:
+    """Drop and recreate every table in the test database."""
     logger.info("Setting up test database...")
     try:
         Base.metadata.drop_all(bind=test_engine)
@@ -102,9 +136,29 @@ def setup_test_database(request):
         logger.error(f"Error setting up test database: {str(e)}")
         raise
 
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_database(request, tmp_path_factory):
+    """
+    Set up the test database before the session starts, and tear it down after tests
+    unless --preserve-db is provided.
+
+    Under pytest-xdist each worker runs its own session against the same database,
+    so only the first worker to take the lock resets the schema; the controller
+    drops it in pytest_sessionfinish once every worker is done.
+    """
+    worker_id = get_worker_id(request.config)
+    if worker_id == "master":
+        _reset_test_database()
+    else:
+        ready_marker = tmp_path_factory.getbasetemp().parent / "test_database.ready"
+        with FileLock(f"{ready_marker}.lock"):
+            if not ready_marker.is_file():
+                _reset_test_database()
+                ready_marker.touch()
+
     yield  # Tests run after this
 
-    if not request.config.getoption("--preserve-db"):
+    if worker_id == "master" and not request.config.getoption("--preserve-db"):
         logger.info("Dropping test database tables...")
         drop_db()
 
@@ -168,20 +222,25 @@ def find_available_port() -> int:
         return s.getsockname()[1]
 
 @pytest.fixture(scope="session")
-def fastapi_server():
+def fastapi_server(request):
     """
     Start a FastAPI test server in a subprocess. If the chosen port (default: 8000)
     is already in use, find another available port. Wait until the server is up
     before yielding its base URL.
+
+    Each pytest-xdist worker starts its own server on a free port, so no worker's
+    teardown can stop a server that another worker is still using.
     """
     base_port = 8000
-    server_url = f'http://127.0.0.1:{base_port}/'
 
     # Check if port is free; if not, pick an available port
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        if s.connect_ex(('127.0.0.1', base_port)) == 0:
-            base_port = find_available_port()
-            server_url = f'http://127.0.0.1:{base_port}/'
+    if get_worker_id(request.config) != "master":
+        base_port = find_available_port()
+    else:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            if s.connect_ex(('127.0.0.1', base_port)) == 0:
+                base_port = find_available_port()
+    server_url = f'http://127.0.0.1:{base_port}/'
 
     logger.info(f"Starting FastAPI server on port {base_port}...")
 
@@ -213,34 +272,139 @@ def fastapi_server():
         process.kill()
         logger.warning("Test server forcefully stopped.")
 
+# ======================================================================================
+# In-Process API Client
+# ======================================================================================
+@pytest.fixture(scope="session")
+def api_client() -> Generator[TestClient, None, None]:
+    """
+    Provide an in-process TestClient for API-level assertions that don't need a
+    browser. Entering the client runs the app's lifespan, as uvicorn would.
+    """
+    # Imported lazily: app.main mounts ./static, so importing it at conftest load
+    # would tie every test run to the repository root.
+    from app.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+@pytest.fixture
+def seeded_user(api_client: TestClient) -> Dict[str, str]:
+    """Register a new user through the in-process API and return its data."""
+    user = create_ui_user("seeded")
+    response = api_client.post("/auth/register", json={**user, "confirm_password": user["password"]})
+    assert response.status_code == 201, f"User registration failed: {response.text}"
+    return user
+
+# ======================================================================================
+# Server Health Cache
+# ======================================================================================
+_SERVER_UP_KEY = pytest.StashKey[bool]()
+_CALL_REPORT_KEY = pytest.StashKey[pytest.TestReport]()
+
+def server_is_healthy(base_url: str, timeout: int = 5) -> bool:
+    """Return True if the server's /health endpoint answers with a 200."""
+    try:
+        return requests.get(f"{base_url}/health", timeout=timeout).status_code == 200
+    except requests.exceptions.RequestException:
+        return False
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    """Keep each test's call-phase report on the item so fixtures can inspect it."""
+    report = yield
+    if report.when == "call":
+        item.stash[_CALL_REPORT_KEY] = report
+    return report
+
+@pytest.fixture(scope="session")
+def _server_health(request, fastapi_server: str) -> None:
+    """Probe the test server once and cache the result on the session stash."""
+    request.session.stash[_SERVER_UP_KEY] = server_is_healthy(fastapi_server.rstrip("/"))
+
+@pytest.fixture
+def skip_if_server_down(request, _server_health, fastapi_server: str):
+    """
+    Skip the test once the server has been seen unreachable. After a failing test
+    the server is probed again, so a crash costs one navigation timeout, not one
+    per remaining test.
+    """
+    if not request.session.stash[_SERVER_UP_KEY]:
+        pytest.skip("FastAPI server unreachable")
+    yield
+    report = request.node.stash.get(_CALL_REPORT_KEY, None)
+    if report is not None and report.failed:
+        request.session.stash[_SERVER_UP_KEY] = server_is_healthy(fastapi_server.rstrip("/"))
+
 # ======================================================================================
 # Playwright Fixtures for UI Testing
 # ======================================================================================
+# Headless Chromium flags: skip the GPU, image decoding and per-site process
+# isolation that the UI tests never exercise.
+CHROMIUM_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--blink-settings=imagesEnabled=false',
+    '--disable-features=IsolateOrigins,site-per-process',
+]
+
 @pytest.fixture(scope="session")
 def browser_context():
-    """Provide a Playwright browser context for UI tests (session-scoped)."""
+    """
+    Provide a Playwright browser for UI tests (session-scoped). Connects to a
+    running `make playwright-server` when PLAYWRIGHT_WS_ENDPOINT is set, otherwise
+    launches Chromium.
+    """
+    ws_endpoint = os.environ.get("PLAYWRIGHT_WS_ENDPOINT")
     with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
-        logger.info("Playwright browser launched.")
+        if ws_endpoint:
+            # run-server launches a fresh browser per connection, using these launch options
+            browser = playwright.chromium.connect(
+                ws_endpoint,
+                headers={"x-playwright-launch-options": json.dumps({"headless": True, "args": CHROMIUM_LAUNCH_ARGS})}
+            )
+            logger.info(f"Connected to Playwright server at {ws_endpoint}.")
+        else:
+            browser = playwright.chromium.launch(
+                headless=True,
+                args=CHROMIUM_LAUNCH_ARGS
+            )
+            logger.info("Playwright browser launched.")
         try:
             yield browser
         finally:
             logger.info("Closing Playwright browser.")
             browser.close()
 
+# Requests the UI assertions never depend on; HTML, JS and CSS are left alone
+# so the pages still render and behave normally.
+BLOCKED_REQUEST_PATTERNS = [
+    re.compile(r"\.(png|jpe?g|svg|gif|woff2?|ttf|ico)(\?.*)?$"),
+    re.compile(r"//[^/]*(google-analytics|googletagmanager|doubleclick)\."),
+]
+
+def _new_context(browser: Browser, **kwargs) -> BrowserContext:
+    """
+    Open a browser context with the standard viewport used by the UI tests,
+    aborting image, font and analytics requests.
+    """
+    context = browser.new_context(
+        viewport={'width': 1920, 'height': 1080},
+        ignore_https_errors=True,
+        **kwargs
+    )
+    for pattern in BLOCKED_REQUEST_PATTERNS:
+        context.route(pattern, lambda route: route.abort())
+    return context
+
 @pytest.fixture
 def page(browser_context: Browser):
     """
     Provide a new browser page for each test, with a standard viewport.
     Closes the page and context after each test.
     """
-    context = browser_context.new_context(
-        viewport={'width': 1920, 'height': 1080},
-        ignore_https_errors=True
-    )
+    context = _new_context(browser_context)
     page = context.new_page()
     logger.info("New browser page created.")
     try:
@@ -250,6 +414,143 @@ def page(browser_context: Browser):
         page.close()
         context.close()
 
+# Sets each input through the native value setter and fires an input event, so page
+# listeners still see the change, all in a single CDP round-trip.
+FIELDS_JS = """fields => {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    for (const [id, value] of Object.entries(fields)) {
+        const el = document.getElementById(id);
+        setValue.call(el, value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+    }
+}"""
+
+def fill_fields(page: Page, fields: Dict[str, str]) -> None:
+    """Fill form inputs, keyed by element id, with one page.evaluate call."""
+    page.evaluate(FIELDS_JS, fields)
+
+def submit_and_await(
+    page: Page,
+    url_or_predicate: Union[str, Callable[[Response], bool]],
+    submit_selector: str = "button[type='submit']",
+    timeout: int = 5000
+) -> Response:
+    """
+    Click a form's submit button and return the API response it triggers, as soon
+    as the server answers instead of polling the UI for the outcome.
+    """
+    with page.expect_response(url_or_predicate, timeout=timeout) as response_info:
+        page.locator(submit_selector).click()
+    return response_info.value
+
+# ======================================================================================
+# Authenticated UI Fixtures
+# ======================================================================================
+def auth_storage_state(base_url: str, token: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a Playwright storage state holding the same localStorage entries that
+    login.html writes after a successful login.
+    """
+    entries = {
+        "access_token": token["access_token"],
+        "refresh_token": token["refresh_token"],
+        "token_expires": token["expires_at"],
+        "user_id": token["user_id"],
+        "username": token["username"],
+    }
+    return {
+        "cookies": [],
+        "origins": [{
+            "origin": base_url,
+            "localStorage": [{"name": name, "value": str(value)} for name, value in entries.items()],
+        }],
+    }
+
+@pytest.fixture(scope="session")
+def api_user_factory(fastapi_server: str):
+    """
+    Return a callable that registers and logs in a new user through the JSON API.
+    The callable returns the user data with the login response under "token".
+    """
+    base_url = fastapi_server.rstrip("/")
+    http = requests.Session()
+
+    def _create_user(prefix: str = "e2e") -> Dict[str, Any]:
+        user = create_ui_user(prefix)
+        reg_response = http.post(
+            f"{base_url}/auth/register",
+            json={**user, "confirm_password": user["password"]}
+        )
+        assert reg_response.status_code == 201, f"User registration failed: {reg_response.text}"
+
+        login_response = http.post(
+            f"{base_url}/auth/login",
+            json={"username": user["username"], "password": user["password"]}
+        )
+        assert login_response.status_code == 200, f"Login failed: {login_response.text}"
+        return {**user, "token": login_response.json()}
+
+    yield _create_user
+    http.close()
+
+@contextmanager
+def _logged_in_page(browser: Browser, base_url: str, storage_state):
+    """Open the dashboard in a new context that starts from the given storage state."""
+    context = _new_context(browser, storage_state=storage_state)
+    page = context.new_page()
+    page.goto(f"{base_url}/dashboard")
+    try:
+        yield page
+    finally:
+        page.close()
+        context.close()
+
+@pytest.fixture(scope="session")
+def auth_state(browser_context: Browser, fastapi_server: str, api_user_factory, tmp_path_factory) -> str:
+    """
+    Log one API-registered user in through the login form and snapshot the
+    resulting storage state to a file, so logged-in tests skip logging in.
+    """
+    base_url = fastapi_server.rstrip("/")
+    user = api_user_factory()
+    state_path = tmp_path_factory.mktemp("auth") / "auth.json"
+
+    context = _new_context(browser_context)
+    page = context.new_page()
+    try:
+        page.goto(f"{base_url}/login")
+        fill_fields(page, {"username": user["username"], "password": user["password"]})
+        response = submit_and_await(page, "**/auth/login")
+        assert response.status == 200, f"UI login failed: {response.status}"
+        # login.html stores the tokens before showing the success alert
+        page.locator("#successAlert").wait_for(state="visible", timeout=5000)
+        context.storage_state(path=str(state_path))
+    finally:
+        page.close()
+        context.close()
+    logger.info(f"Saved UI auth state to {state_path}.")
+    return str(state_path)
+
+@pytest.fixture
+def logged_in_page(browser_context: Browser, fastapi_server: str, auth_state: str):
+    """
+    Provide a dashboard page logged in as the session's shared user. Each test gets
+    its own context, so logging out or navigating away does not leak into others.
+    """
+    with _logged_in_page(browser_context, fastapi_server.rstrip("/"), auth_state) as page:
+        yield page
+
+@pytest.fixture
+def fresh_logged_in_page(browser_context: Browser, fastapi_server: str, api_user_factory):
+    """
+    Provide a dashboard page for a newly registered user, for tests that depend
+    on an untouched calculation history.
+    """
+    base_url = fastapi_server.rstrip("/")
+    user = api_user_factory()
+    with _logged_in_page(browser_context, base_url, auth_storage_state(base_url, user["token"])) as page:
+        yield page
+
 # ======================================================================================
 # Pytest Command-Line Options
 # ======================================================================================
@@ -262,6 +563,18 @@ def pytest_addoption(parser):
     parser.addoption("--preserve-db", action="store_true", help="Keep test database after tests")
     parser.addoption("--run-slow", action="store_true", help="Run tests marked as slow")
 
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Drop the test database from the pytest-xdist controller once all workers
+    have finished (workers skip the drop in setup_test_database).
+    """
+    config = session.config
+    if not config.pluginmanager.hasplugin("dsession"):
+        return
+    if not config.getoption("--preserve-db"):
+        logger.info("Dropping test database tables...")
+        drop_db()
+
 def pytest_collection_modifyitems(config, items):
     """
     Skip tests marked as 'slow' unless --run-slow is specified.
@@ -0,0 +1,58 @@
+"""
+Registration and login validation tests for the auth API
+Run against the in-process TestClient, so they need neither a browser nor the
+uvicorn test server that the Playwright UI tests drive
+"""
+import pytest
+
+from tests.conftest import create_ui_user
+
+
+# ======================================================================================
+# Test User Registration Validation
+# ======================================================================================
+class TestRegistrationValidation:
+    """Test cases for /auth/register request validation"""
+
+    @pytest.mark.api
+    def test_registration_password_mismatch(self, api_client):
+        """Test registration fails when passwords don't match"""
+        response = api_client.post("/auth/register", json={
+            **create_ui_user("testuser"),
+            "confirm_password": "DifferentPass123!"
+        })
+        
+        # Should be rejected by schema validation
+        assert response.status_code == 422, response.text
+        assert "do not match" in response.text
+
+    @pytest.mark.api
+    def test_registration_invalid_email(self, api_client):
+        """Test registration validates email format"""
+        response = api_client.post("/auth/register", json={
+            **create_ui_user("testuser"),
+            "email": "not-a-valid-email"
+        })
+        
+        # Should be rejected by EmailStr validation
+        assert response.status_code == 422, response.text
+        assert "email" in response.text
+
+
+# ======================================================================================
+# Test User Login Validation
+# ======================================================================================
+class TestLoginValidation:
+    """Test cases for /auth/login credential checks"""
+
+    @pytest.mark.api
+    def test_login_nonexistent_user(self, api_client):
+        """Test login fails with non-existent username"""
+        response = api_client.post("/auth/login", json={
+            "username": "nonexistentuser12345",
+            "password": "SomePassword123!"
+        })
+        
+        # Should be rejected without issuing a token
+        assert response.status_code == 401, response.text
+        assert "Invalid username or password" in response.text